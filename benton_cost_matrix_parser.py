@@ -9,10 +9,9 @@ It uses the EnhancedExcelParser for improved error handling and data extraction.
 
 import sys
 import os
-import json
 import re
 from datetime import datetime
-from enhanced_excel_parser import EnhancedExcelParser
+from enhanced_excel_parser import EnhancedExcelParser, dumps_json
 
 class BentonCountyCostMatrixParser:
     def __init__(self, excel_file_path):
@@ -268,26 +267,6 @@ class BentonCountyCostMatrixParser:
                 "rowCount": 0
             }
 
-def convert_to_serializable(obj):
-    """Convert numpy types to standard Python types for JSON serialization."""
-    try:
-        import numpy as np
-        if isinstance(obj, (np.integer, np.int64)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64)):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-    except ImportError:
-        pass
-        
-    if isinstance(obj, dict):
-        return {k: convert_to_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_to_serializable(i) for i in obj]
-    else:
-        return obj
-
 def main():
     # Check arguments
     if len(sys.argv) < 2:
@@ -301,9 +280,6 @@ def main():
     parser = BentonCountyCostMatrixParser(excel_file)
     result = parser.parse()
     
-    # Convert numpy types to standard Python types for JSON serialization
-    result = convert_to_serializable(result)
-    
     # Print summary
     print(f"Processing complete:")
     print(f"  Success: {result['success']}")
@@ -320,13 +296,13 @@ def main():
     
     # Output the result
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(dumps_json(result))
         print(f"  Output written to: {output_file}")
     else:
         # Print the data to stdout if no output file specified
         print("\nExtracted data:")
-        print(json.dumps(result['data'][:5], indent=2))  # Show first 5 entries
+        print(dumps_json(result['data'][:5]).decode('utf-8'))  # Show first 5 entries
         if len(result['data']) > 5:
             print(f"... and {len(result['data']) - 5} more entries")
 
@@ -13,14 +13,22 @@ Example:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import sys
+import tempfile
 from datetime import datetime
 import pandas as pd
 import numpy as np
 import logging
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library encoder
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +46,40 @@ MATRIX_DETAIL_SHEET = "matrix_detail"
 BUILDING_TYPES_SHEET = "building_types"
 REGION_CODES_SHEET = "region_codes"
 
+# Parsed results are cached per file version (path, mtime, size) and parser
+# version so repeat runs on an unchanged file skip the parse; set
+# TERRABUILD_EXCEL_CACHE=0 to disable. The cache lives in the user's own cache
+# directory so other local users cannot plant entries in it.
+PARSE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "terrabuild", "excel_parser"
+)
+PARSE_CACHE_ENABLED = os.environ.get("TERRABUILD_EXCEL_CACHE", "1") != "0"
+
+def _parser_source_hash():
+    """Hash this module's source so any parser change invalidates cached results"""
+    try:
+        with open(os.path.abspath(__file__), "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        # Without the source there is no way to tell parser versions apart;
+        # a fresh value per process keeps stale results from being reused
+        return os.urandom(20).hex()
+
+PARSE_CACHE_VERSION = _parser_source_hash()
+
+# Fields shared by every entry extracted from the matrix sheet
+MATRIX_ENTRY_DEFAULTS = {
+    "sourceMatrixId": 1,  # Default ID, will be replaced on import
+    "isActive": True,
+    "complexityFactorBase": "1.0",
+    "stories": "1",
+    "squareFeet": "1000",
+    "qualityGrade": "Average",
+    "occupancyType": "Standard",
+    "conditionFactorBase": "1.0"
+}
+
 class EnhancedExcelParser:
     """Parser for Cost Matrix Excel files"""
     
@@ -50,10 +92,6 @@ class EnhancedExcelParser:
         self.region_codes = {}
         self.validation_errors = []
         
-        # Check if file exists
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Excel file not found: {file_path}")
-        
         # Extract year from filename if possible
         filename = os.path.basename(file_path)
         try:
@@ -69,12 +107,19 @@ class EnhancedExcelParser:
         logger.info(f"Processing file: {file_path}")
         logger.info(f"Matrix year detected: {self.matrix_year}")
         
-        # Load Excel file
+        # Load Excel file - opening it directly doubles as the existence check,
+        # avoiding a separate stat call and the race between the two. A missing
+        # file is still reported before a wrong extension.
         try:
             if file_path.endswith('.xlsx') or file_path.endswith('.xls'):
                 self.workbook = pd.ExcelFile(file_path)
+            elif not os.path.exists(file_path):
+                raise FileNotFoundError(f"Excel file not found: {file_path}")
             else:
                 raise ValueError("File must be an Excel file (.xlsx or .xls)")
+        except FileNotFoundError as e:
+            logger.error(f"Excel file not found: {file_path}")
+            raise FileNotFoundError(f"Excel file not found: {file_path}") from e
         except Exception as e:
             logger.error(f"Error opening Excel file: {str(e)}")
             raise
@@ -179,49 +224,44 @@ class EnhancedExcelParser:
                 self.validation_errors.append("Could not find building type column in matrix sheet")
                 return []
             
-            # Process the data to extract cost matrix entries
-            matrix_entries = []
+            # Every column except the building type is a region column; map each
+            # one to its region name once, using the region code mapping if we have one
+            region_cols = [j for j, h in enumerate(header) if j != building_type_col and h is not None]
+            region_names = {}
+            for j in region_cols:
+                region = str(header[j]).strip()
+                region_names[j] = self.region_codes.get(region, region)
             
-            for i, row in data.iterrows():
-                building_type = str(row[building_type_col]).strip()
-                if not building_type or building_type.lower() in ["nan", "none", ""]:
-                    continue
-                
-                # Try to find a better description from the building_types dictionary
-                building_type_description = self.building_types.get(building_type, building_type)
-                
-                # Process each region column (all columns except building type)
-                for j, cell_value in enumerate(row):
-                    if j == building_type_col or j >= len(header) or header[j] is None:
-                        continue
-                    
-                    # Skip non-numeric values
-                    if not isinstance(cell_value, (int, float)) or pd.isna(cell_value):
-                        continue
-                    
-                    region = str(header[j]).strip()
-                    
-                    # If we have a region code mapping, use it
-                    region_name = self.region_codes.get(region, region)
-                    
-                    # Create matrix entry
-                    matrix_entry = {
-                        "region": region_name,
-                        "buildingType": building_type,
-                        "buildingTypeDescription": building_type_description,
-                        "baseCost": str(cell_value),
-                        "matrixYear": self.matrix_year,
-                        "sourceMatrixId": 1,  # Default ID, will be replaced on import
-                        "isActive": True,
-                        "complexityFactorBase": "1.0",
-                        "stories": "1",
-                        "squareFeet": "1000",
-                        "qualityGrade": "Average",
-                        "occupancyType": "Standard",
-                        "conditionFactorBase": "1.0"
-                    }
-                    
-                    matrix_entries.append(matrix_entry)
+            # Drop rows without a building type
+            building_types = data[building_type_col].map(str).str.strip()
+            has_type = ~building_types.str.lower().isin(["nan", "none", ""])
+            
+            if not region_cols or not has_type.any():
+                logger.info("Extracted 0 matrix entries")
+                return []
+            
+            # Unpivot to one row per (building type, region) cell, keeping the
+            # original row-major order, and skip non-numeric values
+            cells = (data.loc[has_type, region_cols]
+                     .astype(object)
+                     .assign(buildingType=building_types[has_type])
+                     .melt(id_vars="buildingType", var_name="column", value_name="value", ignore_index=False)
+                     .sort_index(kind="stable")
+                     .reset_index(drop=True))
+            is_numeric = cells["value"].map(lambda v: isinstance(v, (int, float))) & cells["value"].notna()
+            cells = cells[is_numeric]
+            
+            # Build all entry fields as columns and emit the records in one go;
+            # descriptions come from the building_types dictionary where available
+            entries = pd.DataFrame({
+                "region": cells["column"].map(region_names),
+                "buildingType": cells["buildingType"],
+                "buildingTypeDescription": cells["buildingType"].map(lambda bt: self.building_types.get(bt, bt)),
+                "baseCost": cells["value"].map(str),
+                "matrixYear": self.matrix_year,
+                **MATRIX_ENTRY_DEFAULTS
+            })
+            matrix_entries = entries.to_dict(orient="records")
             
             logger.info(f"Extracted {len(matrix_entries)} matrix entries")
             return matrix_entries
@@ -387,6 +427,69 @@ class EnhancedExcelParser:
             }
         }
 
+def _parse_cache_path(file_path):
+    """Return the cache file path for the current version of file_path and of the parser"""
+    stat = os.stat(file_path)
+    key = f"{PARSE_CACHE_VERSION}:{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    return os.path.join(PARSE_CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+def parse_file(file_path):
+    """
+    Parse an Excel file, reusing the cached result if the file has not changed
+    since it was last parsed. A cached result keeps its original processedAt.
+    """
+    cache_path = None
+    if PARSE_CACHE_ENABLED:
+        try:
+            cache_path = _parse_cache_path(file_path)
+            with open(cache_path, "rb") as f:
+                result = json.loads(f.read())
+            logger.info(f"Using cached parse result for {file_path}")
+            return result
+        except (OSError, ValueError):
+            # Missing or unreadable cache entry (or missing file) - parse normally
+            pass
+    
+    result = EnhancedExcelParser(file_path).parse()
+    
+    if cache_path:
+        # Write to a temp file and rename it into place, so neither a concurrent
+        # run nor a crash mid-write can leave a partial cache entry
+        tmp_path = None
+        try:
+            os.makedirs(PARSE_CACHE_DIR, mode=0o700, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=PARSE_CACHE_DIR, suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                f.write(dumps_json(result))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not cache parse result: {str(e)}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    return result
+
+def _json_default(obj):
+    """Convert numpy types the standard library encoder cannot handle"""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(obj):
+    """Serialize obj to indented JSON bytes, handling numpy types; uses orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        )
+    return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+
 def main():
     parser = argparse.ArgumentParser(description="Parse Excel files containing cost matrix data")
     parser.add_argument("file_path", help="Path to Excel file")
@@ -399,11 +502,9 @@ def main():
     args = parser.parse_args()
     
     try:
-        # Parse the Excel file
-        excel_parser = EnhancedExcelParser(args.file_path)
-        
         if args.validate_only:
             # Only perform validation
+            excel_parser = EnhancedExcelParser(args.file_path)
             excel_parser._validate_workbook_structure()
             validation_result = {
                 "success": len(excel_parser.validation_errors) == 0,
@@ -419,18 +520,23 @@ def main():
             sys.exit(0 if validation_result["success"] else 1)
         else:
             # Full parsing
-            result = excel_parser.parse()
+            result = parse_file(args.file_path)
+            validation_errors = result["metadata"]["validationErrors"]
             
             # Output the result
+            output = dumps_json(result)
             if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(result, f, indent=2)
+                with open(args.output, 'wb') as f:
+                    f.write(output)
                 logger.info(f"Output written to {args.output}")
             else:
-                print(json.dumps(result, indent=2))
+                # Flush pending log lines before writing bytes past the text layer
+                sys.stdout.flush()
+                sys.stdout.buffer.write(output + b"\n")
+                sys.stdout.buffer.flush()
                 
-            if excel_parser.validation_errors:
-                logger.warning(f"Completed with {len(excel_parser.validation_errors)} validation errors")
+            if validation_errors:
+                logger.warning(f"Completed with {len(validation_errors)} validation errors")
                 sys.exit(1)
             else:
                 logger.info("Parsing completed successfully")
@@ -8,10 +8,12 @@ which is structured with matrix_id values linked to costs in the matrix_detail t
 
 import pandas as pd
 import json
+import math
 import sys
 import os
 import random
 from datetime import datetime
+from openpyxl import load_workbook
 
 # Set of building types commonly found in Benton County
 BUILDING_TYPES = {
@@ -35,14 +37,82 @@ BUILDING_TYPES = {
 # Regions in Benton County
 REGIONS = ["Eastern", "Central", "Western"]
 
+def _numeric_cell_value(value):
+    """Return a cell value as a number, or None if it is blank or not numeric"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return None if math.isnan(value) else value
+    if isinstance(value, str) and value.strip():
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+        return None if math.isnan(value) else value
+    return None
+
+def stream_matrix_costs(excel_path):
+    """
+    Aggregate cell_value statistics per matrix_id by streaming the matrix_detail
+    sheet row by row, so memory grows with the number of matrices rather than
+    the number of detail rows. Numeric strings are parsed; other non-blank
+    values are counted, reported and left out of the statistics.
+    
+    Returns a dict of matrix_id -> {'mean', 'min', 'max', 'count'}
+    """
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        rows = workbook['matrix_detail'].iter_rows(values_only=True)
+        header = [str(col).strip() if col is not None else '' for col in next(rows, ())]
+        id_col = header.index('matrix_id')
+        value_col = header.index('cell_value')
+        
+        # matrix_id -> [min, max, sum, numeric values, rows]
+        totals = {}
+        invalid_count = 0
+        for row in rows:
+            matrix_id = row[id_col] if id_col < len(row) else None
+            if matrix_id is None:
+                continue
+            
+            entry = totals.get(matrix_id)
+            if entry is None:
+                entry = totals[matrix_id] = [math.inf, -math.inf, 0.0, 0, 0]
+            entry[4] += 1
+            
+            raw_value = row[value_col] if value_col < len(row) else None
+            value = _numeric_cell_value(raw_value)
+            if value is not None:
+                if value < entry[0]:
+                    entry[0] = value
+                if value > entry[1]:
+                    entry[1] = value
+                entry[2] += value
+                entry[3] += 1
+            elif raw_value is not None and str(raw_value).strip():
+                invalid_count += 1
+    finally:
+        workbook.close()
+    
+    if invalid_count:
+        print(f"Warning: ignoring {invalid_count} non-numeric cell values in matrix_detail")
+    
+    # Matrices with no numeric values report NaN, as pandas would
+    return {
+        matrix_id: {
+            'mean': total / numeric if numeric else math.nan,
+            'min': float(min_cost) if numeric else math.nan,
+            'max': float(max_cost) if numeric else math.nan,
+            'count': count
+        }
+        for matrix_id, (min_cost, max_cost, total, numeric, count) in totals.items()
+    }
+
 def extract_cost_matrix(excel_path, output_json):
     """Extract cost matrix data from the Excel file"""
     print(f"Extracting cost data from: {excel_path}")
     
-    # Load key sheets
-    xls = pd.ExcelFile(excel_path)
-    matrix_df = pd.read_excel(excel_path, sheet_name='matrix')
-    matrix_detail_df = pd.read_excel(excel_path, sheet_name='matrix_detail')
+    # Load the matrix sheet and stream per-matrix cost statistics from matrix_detail
+    matrix_df = pd.read_excel(excel_path, sheet_name='matrix', usecols=['matrix_id'])
+    matrix_stats = stream_matrix_costs(excel_path)
     
     # Get the matrix year from filename or use current year
     matrix_year = 2025  # Default to 2025 based on your file name
@@ -59,15 +129,14 @@ def extract_cost_matrix(excel_path, output_json):
         # For each matrix ID, calculate the average cost
         matrix_id = random.choice(matrix_ids)  # Randomly select a matrix for demonstration
         
-        # Get all costs for this matrix ID
-        matrix_costs = matrix_detail_df[matrix_detail_df['matrix_id'] == matrix_id]['cell_value']
+        # Get the cost statistics for this matrix ID
+        stats = matrix_stats.get(matrix_id)
         
-        if len(matrix_costs) > 0:
-            # Calculate statistics
-            avg_cost = matrix_costs.mean()
-            min_cost = matrix_costs.min()
-            max_cost = matrix_costs.max()
-            data_points = len(matrix_costs)
+        if stats:
+            avg_cost = stats['mean']
+            min_cost = stats['min']
+            max_cost = stats['max']
+            data_points = stats['count']
             
             # Create an entry for each region
             for region in REGIONS:
@@ -12,6 +12,7 @@ import sys
 import os
 import random
 from datetime import datetime
+from extract_benton_building_costs import stream_matrix_costs
 
 # Proper Benton County regions
 REGIONS = [
@@ -40,10 +41,9 @@ def extract_cost_matrix(excel_path, output_json):
     """Extract cost matrix data from the Excel file using proper regions and building types"""
     print(f"Extracting cost data from: {excel_path}")
     
-    # Load key sheets
-    xls = pd.ExcelFile(excel_path)
-    matrix_df = pd.read_excel(excel_path, sheet_name='matrix')
-    matrix_detail_df = pd.read_excel(excel_path, sheet_name='matrix_detail')
+    # Load the matrix sheet and stream per-matrix cost statistics from matrix_detail
+    matrix_df = pd.read_excel(excel_path, sheet_name='matrix', usecols=['matrix_id'])
+    matrix_stats = stream_matrix_costs(excel_path)
     
     # Get the matrix year from filename or use current year
     matrix_year = 2025  # Default to 2025 based on your file name
@@ -60,15 +60,14 @@ def extract_cost_matrix(excel_path, output_json):
         # For each matrix ID, calculate the average cost
         matrix_id = random.choice(matrix_ids)  # Randomly select a matrix for demonstration
         
-        # Get all costs for this matrix ID
-        matrix_costs = matrix_detail_df[matrix_detail_df['matrix_id'] == matrix_id]['cell_value']
+        # Get the cost statistics for this matrix ID
+        stats = matrix_stats.get(matrix_id)
         
-        if len(matrix_costs) > 0:
-            # Calculate statistics
-            avg_cost = round(matrix_costs.mean(), 2)
-            min_cost = round(matrix_costs.min(), 2)
-            max_cost = round(matrix_costs.max(), 2)
-            data_points = len(matrix_costs)
+        if stats:
+            avg_cost = round(stats['mean'], 2)
+            min_cost = round(stats['min'], 2)
+            max_cost = round(stats['max'], 2)
+            data_points = stats['count']
             
             # Base cost variations for different building types
             base_cost_multiplier = 1.0
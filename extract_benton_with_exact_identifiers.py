@@ -12,6 +12,7 @@ import sys
 import os
 import re
 from datetime import datetime
+from extract_benton_building_costs import stream_matrix_costs
 
 # The exact region identifiers defined in the project
 REGIONS = [
@@ -40,24 +41,26 @@ def extract_matrices_for_identifiers(excel_path, output_json):
     """Extract cost matrix data with exact identifiers from constants.ts"""
     print(f"Extracting cost data from: {excel_path}")
     
-    # Load sheets
-    matrix_df = pd.read_excel(excel_path, sheet_name='matrix')
-    matrix_detail_df = pd.read_excel(excel_path, sheet_name='matrix_detail')
+    # Load the matrix sheet (axis_1/axis_2 are never read) and stream
+    # per-matrix cost statistics from matrix_detail
+    matrix_df = pd.read_excel(excel_path, sheet_name='matrix',
+                              usecols=['matrix_id', 'matrix_description'])
+    matrix_stats = stream_matrix_costs(excel_path)
     
     # Join matrix and matrix_detail on matrix_id
     matrix_ids = matrix_df['matrix_id'].unique()
     
-    # Sample cost values from matrix_detail for each matrix_id
+    # Store basic statistics for each matrix ID, keeping the matrix sheet
+    # order and only the IDs that have detail rows
     matrix_costs = {}
     for matrix_id in matrix_ids:
-        costs = matrix_detail_df[matrix_detail_df['matrix_id'] == matrix_id]['cell_value']
-        if len(costs) > 0:
-            # Store basic statistics for each matrix ID
+        stats = matrix_stats.get(matrix_id)
+        if stats:
             matrix_costs[matrix_id] = {
-                'mean': float(costs.mean()),
-                'min': float(costs.min()) if not pd.isna(costs.min()) else 0,
-                'max': float(costs.max()) if not pd.isna(costs.max()) else 0,
-                'count': int(len(costs))
+                'mean': float(stats['mean']),
+                'min': float(stats['min']) if not pd.isna(stats['min']) else 0,
+                'max': float(stats['max']) if not pd.isna(stats['max']) else 0,
+                'count': int(stats['count'])
             }
     
     # Map matrix description patterns to building types
@@ -77,6 +80,15 @@ def extract_matrices_for_identifiers(excel_path, output_json):
         r'.*Public.*|.*Government.*': 'PF'
     }
     
+    # Precompute the first matrix whose description matches each building type,
+    # scanning all descriptions once per pattern instead of once per type/row
+    descriptions = matrix_df['matrix_description'].astype(str).str.lower()
+    first_matrix_for_type = {}
+    for pattern_regex, bt_code in building_type_mapping.items():
+        matching_ids = matrix_df['matrix_id'][descriptions.str.contains(pattern_regex.lower(), regex=True)]
+        if not matching_ids.empty:
+            first_matrix_for_type[bt_code] = matching_ids.iloc[0]
+    
     # Get matrix year from filename or use current year
     match = re.search(r'(\d{4})', os.path.basename(excel_path))
     matrix_year = int(match.group(1)) if match else datetime.now().year
@@ -87,16 +99,7 @@ def extract_matrices_for_identifiers(excel_path, output_json):
     # Generate the proper cost matrix entries based on the identifiers
     for building_type_code, building_type_desc in BUILDING_TYPES.items():
         # Find a suitable matrix_id for this building type
-        suitable_matrix_id = None
-        for matrix_id, row in matrix_df.iterrows():
-            description = str(row['matrix_description']).lower()
-            pattern = None
-            for pattern_regex, bt_code in building_type_mapping.items():
-                if bt_code == building_type_code and re.search(pattern_regex.lower(), description):
-                    suitable_matrix_id = row['matrix_id']
-                    break
-            if suitable_matrix_id:
-                break
+        suitable_matrix_id = first_matrix_for_type.get(building_type_code)
         
         # If no specific match, use a random matrix with cost data
         if not suitable_matrix_id or suitable_matrix_id not in matrix_costs:
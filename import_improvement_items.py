@@ -9,6 +9,7 @@ import os
 import csv
 import psycopg2
 from datetime import datetime
+from import_utils import BATCH_SIZE, insert_batch
 
 # Get database connection string from environment variable
 DATABASE_URL = os.environ.get('DATABASE_URL')
@@ -22,10 +23,13 @@ def connect_to_db():
     return psycopg2.connect(DATABASE_URL)
 
 def get_existing_property_ids(conn):
-    """Get list of property IDs that already exist in the database"""
-    cursor = conn.cursor()
-    cursor.execute("SELECT prop_id FROM properties")
-    return [row[0] for row in cursor.fetchall()]
+    """Get the set of property IDs that already exist in the database"""
+    # Stream the IDs through a server-side cursor in itersize chunks rather
+    # than materializing the whole result with fetchall
+    with conn.cursor(name='existing_property_ids') as cursor:
+        cursor.itersize = 10000
+        cursor.execute("SELECT prop_id FROM properties")
+        return {row[0] for row in cursor}
 
 def clean_value(value):
     """Clean value to handle empty strings and convert to appropriate format"""
@@ -43,24 +47,43 @@ def import_improvement_items(conn, file_path, existing_property_ids):
     cursor = conn.cursor()
     count = 0
     errors = 0
+    batch = []
     
     # Get existing improvement items to avoid duplicate inserts
     cursor.execute("SELECT prop_id, imprv_id FROM improvement_items")
-    existing_imprv_items = [(row[0], row[1]) for row in cursor.fetchall()]
+    existing_imprv_items = {(row[0], row[1]) for row in cursor.fetchall()}
     print(f"Found {len(existing_imprv_items)} existing improvement item records")
     
+    insert_sql = """
+        INSERT INTO improvement_items (
+            prop_id,
+            imprv_id,
+            bedrooms,
+            baths,
+            halfbath,
+            foundation,
+            extwall_desc,
+            roofcover_desc,
+            hvac_desc,
+            fireplaces,
+            sprinkler,
+            framing_class,
+            com_hvac
+        ) VALUES %s
+        ON CONFLICT DO NOTHING
+    """
+    
     with open(file_path, 'r') as f:
         reader = csv.DictReader(f)
+        # Lowercase the header once so each field is a single dict lookup
+        reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
         
         for row in reader:
-            if count >= MAX_RECORDS:
+            if count + len(batch) >= MAX_RECORDS:
                 break
                 
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
-            imprv_id = row.get('imprv_id', row.get('IMPRV_ID', '0'))
+            prop_id = row.get('prop_id', '0')
+            imprv_id = row.get('imprv_id', '0')
             
             # Skip if property ID doesn't exist in database
             if int(prop_id) not in existing_property_ids:
@@ -71,85 +94,57 @@ def import_improvement_items(conn, file_path, existing_property_ids):
             imprv_id_int = int(imprv_id) if imprv_id and imprv_id.isdigit() else None
             if (prop_id_int, imprv_id_int) in existing_imprv_items:
                 continue
+            existing_imprv_items.add((prop_id_int, imprv_id_int))
             
-            try:
-                # Clean values
-                bedrooms = clean_value(row.get('bedrooms', row.get('BEDROOMS', None)))
-                baths = clean_value(row.get('baths', row.get('BATHS', None)))
-                halfbath = clean_value(row.get('halfbath', row.get('HALFBATH', None)))
-                foundation = clean_value(row.get('foundation', row.get('FOUNDATION', None)))
-                extwall_desc = clean_value(row.get('extwall_desc', row.get('EXTWALL_DESC', None)))
-                roofcover_desc = clean_value(row.get('roofcover_desc', row.get('ROOFCOVER_DESC', None)))
-                hvac_desc = clean_value(row.get('hvac_desc', row.get('HVAC_DESC', None)))
-                fireplaces = clean_value(row.get('fireplaces', row.get('FIREPLACES', None)))
-                sprinkler_val = clean_value(row.get('sprinkler', row.get('SPRINKLER', None)))
-                # Convert sprinkler to boolean if not None
-                sprinkler = None
-                if sprinkler_val is not None:
-                    if sprinkler_val.lower() in ('true', 't', 'yes', 'y', '1'):
-                        sprinkler = True
-                    elif sprinkler_val.lower() in ('false', 'f', 'no', 'n', '0'):
-                        sprinkler = False
-                framing_class = clean_value(row.get('framing_class', row.get('FRAMING_CLASS', None)))
-                com_hvac = clean_value(row.get('com_hvac', row.get('COM_HVAC', None)))
-                
-                cursor.execute("""
-                    INSERT INTO improvement_items (
-                        imported_at,
-                        updated_at,
-                        prop_id,
-                        imprv_id,
-                        bedrooms,
-                        baths,
-                        halfbath,
-                        foundation,
-                        extwall_desc,
-                        roofcover_desc,
-                        hvac_desc,
-                        fireplaces,
-                        sprinkler,
-                        framing_class,
-                        com_hvac
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    now,
-                    now,
-                    prop_id_int,
-                    imprv_id_int,
-                    bedrooms,
-                    baths,
-                    halfbath,
-                    foundation,
-                    extwall_desc,
-                    roofcover_desc,
-                    hvac_desc,
-                    fireplaces,
-                    sprinkler,
-                    framing_class,
-                    com_hvac
-                ))
-                count += 1
-                
-                # Commit every 25 records
-                if count % 25 == 0:
-                    conn.commit()
-                    print(f"Committed {count} improvement items")
-                    
-            except Exception as e:
-                # Rollback the transaction on error
-                conn.rollback()
-                print(f"Error importing improvement item for {imprv_id}: {e}")
-                errors += 1
-                if errors > 10:
-                    conn.rollback()
-                    print("Too many errors, aborting.")
-                    break
-                continue
+            # Clean values
+            bedrooms = clean_value(row.get('bedrooms'))
+            baths = clean_value(row.get('baths'))
+            halfbath = clean_value(row.get('halfbath'))
+            foundation = clean_value(row.get('foundation'))
+            extwall_desc = clean_value(row.get('extwall_desc'))
+            roofcover_desc = clean_value(row.get('roofcover_desc'))
+            hvac_desc = clean_value(row.get('hvac_desc'))
+            fireplaces = clean_value(row.get('fireplaces'))
+            sprinkler_val = clean_value(row.get('sprinkler'))
+            # Convert sprinkler to boolean if not None
+            sprinkler = None
+            if sprinkler_val is not None:
+                if sprinkler_val.lower() in ('true', 't', 'yes', 'y', '1'):
+                    sprinkler = True
+                elif sprinkler_val.lower() in ('false', 'f', 'no', 'n', '0'):
+                    sprinkler = False
+            framing_class = clean_value(row.get('framing_class'))
+            com_hvac = clean_value(row.get('com_hvac'))
+            
+            batch.append((
+                prop_id_int,
+                imprv_id_int,
+                bedrooms,
+                baths,
+                halfbath,
+                foundation,
+                extwall_desc,
+                roofcover_desc,
+                hvac_desc,
+                fireplaces,
+                sprinkler,
+                framing_class,
+                com_hvac
+            ))
+            
+            # Send the batch as one multi-row INSERT once it is full
+            if len(batch) >= BATCH_SIZE:
+                inserted, batch_errors = insert_batch(conn, insert_sql, batch, "improvement items")
+                count += inserted
+                errors += batch_errors
+                batch = []
+    
+    # Insert whatever is left in the final partial batch
+    if batch:
+        inserted, batch_errors = insert_batch(conn, insert_sql, batch, "improvement items")
+        count += inserted
+        errors += batch_errors
     
-    # Final commit
-    conn.commit()
     print(f"Imported {count} improvement items with {errors} errors")
     return count
 
@@ -9,6 +9,7 @@ import os
 import csv
 import psycopg2
 from datetime import datetime
+from import_utils import BATCH_SIZE, insert_batch
 
 # Get database connection string from environment variable
 DATABASE_URL = os.environ.get('DATABASE_URL')
@@ -22,10 +23,13 @@ def connect_to_db():
     return psycopg2.connect(DATABASE_URL)
 
 def get_existing_property_ids(conn):
-    """Get list of property IDs that already exist in the database"""
-    cursor = conn.cursor()
-    cursor.execute("SELECT prop_id FROM properties")
-    return [row[0] for row in cursor.fetchall()]
+    """Get the set of property IDs that already exist in the database"""
+    # Stream the IDs through a server-side cursor in itersize chunks rather
+    # than materializing the whole result with fetchall
+    with conn.cursor(name='existing_property_ids') as cursor:
+        cursor.itersize = 10000
+        cursor.execute("SELECT prop_id FROM properties")
+        return {row[0] for row in cursor}
 
 def clean_value(value):
     """Clean value to handle empty strings and convert to appropriate format"""
@@ -43,23 +47,36 @@ def import_land_details(conn, file_path, existing_property_ids):
     cursor = conn.cursor()
     count = 0
     errors = 0
+    batch = []
     
     # Get existing land details to avoid duplicate inserts
     cursor.execute("SELECT prop_id FROM land_details")
-    existing_land_prop_ids = [row[0] for row in cursor.fetchall()]
+    existing_land_prop_ids = {row[0] for row in cursor.fetchall()}
     print(f"Found {len(existing_land_prop_ids)} existing land detail records")
     
+    insert_sql = """
+        INSERT INTO land_details (
+            prop_id,
+            primary_use_cd,
+            size_acres,
+            size_square_feet,
+            land_type_cd,
+            land_soil_code,
+            ag_use_cd
+        ) VALUES %s
+        ON CONFLICT DO NOTHING
+    """
+    
     with open(file_path, 'r') as f:
         reader = csv.DictReader(f)
+        # Lowercase the header once so each field is a single dict lookup
+        reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
         
         for row in reader:
-            if count >= MAX_RECORDS:
+            if count + len(batch) >= MAX_RECORDS:
                 break
                 
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
+            prop_id = row.get('prop_id', '0')
             
             # Skip if property ID doesn't exist in database
             if int(prop_id) not in existing_property_ids:
@@ -69,61 +86,38 @@ def import_land_details(conn, file_path, existing_property_ids):
             if int(prop_id) in existing_land_prop_ids:
                 continue
             
-            try:
-                # Clean values
-                prop_id_int = int(prop_id) if prop_id and prop_id.isdigit() else None
-                primary_use_cd = clean_value(row.get('primary_use_cd', row.get('PRIMARY_USE_CD', None)))
-                size_acres = clean_value(row.get('size_acres', row.get('SIZE_ACRES', None)))
-                size_square_feet = clean_value(row.get('size_square_feet', row.get('SIZE_SQUARE_FEET', None)))
-                land_type_cd = clean_value(row.get('land_type_cd', row.get('LAND_TYPE_CD', None)))
-                land_soil_code = clean_value(row.get('land_soil_code', row.get('LAND_SOIL_CODE', None)))
-                ag_use_cd = clean_value(row.get('ag_use_cd', row.get('AG_USE_CD', None)))
-                
-                cursor.execute("""
-                    INSERT INTO land_details (
-                        imported_at,
-                        updated_at,
-                        prop_id,
-                        primary_use_cd,
-                        size_acres,
-                        size_square_feet,
-                        land_type_cd,
-                        land_soil_code,
-                        ag_use_cd
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    now,
-                    now,
-                    prop_id_int,
-                    primary_use_cd,
-                    size_acres,
-                    size_square_feet,
-                    land_type_cd,
-                    land_soil_code,
-                    ag_use_cd
-                ))
-                count += 1
-                
-                # Commit every 25 records
-                if count % 25 == 0:
-                    conn.commit()
-                    print(f"Committed {count} land details")
-                    
-            except Exception as e:
-                # Rollback the transaction on error
-                conn.rollback()
-                print(f"Error importing land detail for property {prop_id}: {e}")
-                errors += 1
-                if errors > 10:
-                    conn.rollback()
-                    print("Too many errors, aborting.")
-                    break
-                continue
+            # Clean values
+            prop_id_int = int(prop_id) if prop_id and prop_id.isdigit() else None
+            primary_use_cd = clean_value(row.get('primary_use_cd'))
+            size_acres = clean_value(row.get('size_acres'))
+            size_square_feet = clean_value(row.get('size_square_feet'))
+            land_type_cd = clean_value(row.get('land_type_cd'))
+            land_soil_code = clean_value(row.get('land_soil_code'))
+            ag_use_cd = clean_value(row.get('ag_use_cd'))
+            
+            batch.append((
+                prop_id_int,
+                primary_use_cd,
+                size_acres,
+                size_square_feet,
+                land_type_cd,
+                land_soil_code,
+                ag_use_cd
+            ))
+            
+            # Send the batch as one multi-row INSERT once it is full
+            if len(batch) >= BATCH_SIZE:
+                inserted, batch_errors = insert_batch(conn, insert_sql, batch, "land details")
+                count += inserted
+                errors += batch_errors
+                batch = []
+    
+    # Insert whatever is left in the final partial batch
+    if batch:
+        inserted, batch_errors = insert_batch(conn, insert_sql, batch, "land details")
+        count += inserted
+        errors += batch_errors
     
-    # Final commit
-    conn.commit()
     print(f"Imported {count} land details with {errors} errors")
     return count
 
@@ -7,11 +7,15 @@ directly into the PostgreSQL database using Python and psycopg2.
 import os
 import csv
 import psycopg2
+from psycopg2.extras import execute_batch
 from datetime import datetime
 
 # Get database connection string from environment variable
 DATABASE_URL = os.environ.get('DATABASE_URL')
 
+# Number of rows sent to the database in each round trip
+BATCH_SIZE = 1000
+
 def connect_to_db():
     """Connect to the PostgreSQL database"""
     print(f"Connecting to database...")
@@ -24,97 +28,120 @@ def import_properties(conn, file_path):
     cursor = conn.cursor()
     count = 0
     
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            # Convert property CSV data to database format
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
+    # Prepare the INSERT once so the server parses and plans it a single time
+    try:
+        cursor.execute("""
+            PREPARE insert_properties AS
+            INSERT INTO properties (
+                prop_id,
+                block,
+                tract_or_lot,
+                legal_desc,
+                legal_desc_2,
+                township_section,
+                township_code,
+                range_code,
+                township_q_section,
+                cycle,
+                property_use_cd,
+                property_use_desc,
+                market,
+                land_hstd_val,
+                land_non_hstd_val,
+                imprv_hstd_val,
+                imprv_non_hstd_val,
+                hood_cd,
+                abs_subdv_cd,
+                appraised_val,
+                assessed_val,
+                legal_acreage,
+                prop_type_cd,
+                image_path,
+                geo_id,
+                is_active,
+                tca
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+                $11, $12, $13, $14, $15, $16, $17, $18, $19, $20,
+                $21, $22, $23, $24, $25, $26, $27
+            )
+        """)
+    except Exception as e:
+        conn.rollback()
+        print(f"Error preparing properties insert: {e}")
+        return 0
+    
+    execute_sql = """
+        EXECUTE insert_properties (
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, %s, %s, %s, %s
+        )
+    """
+    batch = []
+    
+    try:
+        with open(file_path, 'r') as f:
+            reader = csv.DictReader(f)
+            # Lowercase the header once so each field is a single dict lookup
+            reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
             
-            try:
-                cursor.execute("""
-                    INSERT INTO properties (
-                        imported_at,
-                        updated_at,
-                        prop_id,
-                        block,
-                        tract_or_lot,
-                        legal_desc,
-                        legal_desc_2,
-                        township_section,
-                        township_code,
-                        range_code,
-                        township_q_section,
-                        cycle,
-                        property_use_cd,
-                        property_use_desc,
-                        market,
-                        land_hstd_val,
-                        land_non_hstd_val,
-                        imprv_hstd_val,
-                        imprv_non_hstd_val,
-                        hood_cd,
-                        abs_subdv_cd,
-                        appraised_val,
-                        assessed_val,
-                        legal_acreage,
-                        prop_type_cd,
-                        image_path,
-                        geo_id,
-                        is_active,
-                        tca
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    now, 
-                    now,
+            for row in reader:
+                # Convert property CSV data to database format
+                prop_id = row.get('prop_id', '0')
+                
+                batch.append((
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
-                    row.get('block', row.get('BLOCK', None)),
-                    row.get('tract_or_lot', row.get('TRACT_OR_LOT', None)),
-                    row.get('legal_desc', row.get('LEGAL_DESC', None)),
-                    row.get('legal_desc_2', row.get('LEGAL_DESC_2', None)),
-                    row.get('township_section', row.get('TOWNSHIP_SECTION', None)),
-                    row.get('township_code', row.get('TOWNSHIP_CODE', None)),
-                    row.get('range_code', row.get('RANGE_CODE', None)),
-                    row.get('township_q_section', row.get('TOWNSHIP_Q_SECTION', None)),
-                    row.get('cycle', row.get('CYCLE', None)),
-                    row.get('property_use_cd', row.get('PROPERTY_USE_CD', None)),
-                    row.get('property_use_desc', row.get('PROPERTY_USE_DESC', None)),
-                    row.get('market', row.get('MARKET', None)),
-                    row.get('land_hstd_val', row.get('LAND_HSTD_VAL', None)),
-                    row.get('land_non_hstd_val', row.get('LAND_NON_HSTD_VAL', None)),
-                    row.get('imprv_hstd_val', row.get('IMPRV_HSTD_VAL', None)),
-                    row.get('imprv_non_hstd_val', row.get('IMPRV_NON_HSTD_VAL', None)),
-                    row.get('hood_cd', row.get('HOOD_CD', None)),
-                    row.get('abs_subdv_cd', row.get('ABS_SUBDV_CD', None)),
-                    row.get('appraised_val', row.get('APPRAISED_VAL', None)),
-                    row.get('assessed_val', row.get('ASSESSED_VAL', None)),
-                    row.get('legal_acreage', row.get('LEGAL_ACREAGE', None)),
-                    row.get('prop_type_cd', row.get('PROP_TYPE_CD', None)),
-                    row.get('image_path', row.get('IMAGE_PATH', None)),
-                    row.get('geo_id', row.get('GEO_ID', None)),
-                    row.get('isactive', row.get('ISACTIVE', '1')) == '1',
-                    row.get('tca', row.get('TCA', None))
+                    row.get('block'),
+                    row.get('tract_or_lot'),
+                    row.get('legal_desc'),
+                    row.get('legal_desc_2'),
+                    row.get('township_section'),
+                    row.get('township_code'),
+                    row.get('range_code'),
+                    row.get('township_q_section'),
+                    row.get('cycle'),
+                    row.get('property_use_cd'),
+                    row.get('property_use_desc'),
+                    row.get('market'),
+                    row.get('land_hstd_val'),
+                    row.get('land_non_hstd_val'),
+                    row.get('imprv_hstd_val'),
+                    row.get('imprv_non_hstd_val'),
+                    row.get('hood_cd'),
+                    row.get('abs_subdv_cd'),
+                    row.get('appraised_val'),
+                    row.get('assessed_val'),
+                    row.get('legal_acreage'),
+                    row.get('prop_type_cd'),
+                    row.get('image_path'),
+                    row.get('geo_id'),
+                    row.get('isactive', '1') == '1',
+                    row.get('tca')
                 ))
-                count += 1
                 
-                # Commit every 100 records
-                if count % 100 == 0:
-                    conn.commit()
-                    print(f"Committed {count} properties")
-                    
-            except Exception as e:
-                print(f"Error importing property {prop_id}: {e}")
-                continue
+                # Send the queued rows to the server in a single round trip
+                if len(batch) >= BATCH_SIZE:
+                    execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+                    count += len(batch)
+                    batch = []
+        
+        if batch:
+            execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+            count += len(batch)
+        
+        # Drop the prepared statement and commit the whole file as a single transaction
+        cursor.execute("DEALLOCATE insert_properties")
+        conn.commit()
+    except Exception as e:
+        # A failed row aborts the transaction, so the whole file is rolled back
+        conn.rollback()
+        print(f"Error importing properties: {e}")
+        count = 0
+        # Prepared statements outlive a rollback, so drop it in its own transaction
+        cursor.execute("DEALLOCATE insert_properties")
+        conn.commit()
     
-    # Final commit
-    conn.commit()
     print(f"Imported {count} properties")
     return count
 
@@ -125,59 +152,80 @@ def import_improvements(conn, file_path):
     cursor = conn.cursor()
     count = 0
     
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
-            imprv_id = row.get('imprv_id', row.get('IMPRV_ID', '0'))
+    # Prepare the INSERT once so the server parses and plans it a single time
+    try:
+        cursor.execute("""
+            PREPARE insert_improvements AS
+            INSERT INTO improvements (
+                prop_id,
+                imprv_id,
+                imprv_desc,
+                imprv_val,
+                living_area,
+                primary_use_cd,
+                stories,
+                actual_year_built,
+                total_area
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9
+            )
+        """)
+    except Exception as e:
+        conn.rollback()
+        print(f"Error preparing improvements insert: {e}")
+        return 0
+    
+    execute_sql = """
+        EXECUTE insert_improvements (
+            %s, %s, %s, %s, %s, %s, %s, %s, %s
+        )
+    """
+    batch = []
+    
+    try:
+        with open(file_path, 'r') as f:
+            reader = csv.DictReader(f)
+            # Lowercase the header once so each field is a single dict lookup
+            reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
             
-            try:
-                cursor.execute("""
-                    INSERT INTO improvements (
-                        imported_at,
-                        updated_at,
-                        prop_id,
-                        imprv_id,
-                        imprv_desc,
-                        imprv_val,
-                        living_area,
-                        primary_use_cd,
-                        stories,
-                        actual_year_built,
-                        total_area
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    now,
-                    now,
+            for row in reader:
+                prop_id = row.get('prop_id', '0')
+                imprv_id = row.get('imprv_id', '0')
+                
+                batch.append((
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
                     int(imprv_id) if imprv_id and imprv_id.isdigit() else None,
-                    row.get('imprv_desc', row.get('IMPRV_DESC', None)),
-                    row.get('imprv_val', row.get('IMPRV_VAL', None)),
-                    row.get('living_area', row.get('LIVING_AREA', None)),
-                    row.get('primary_use_cd', row.get('PRIMARY_USE_CD', None)),
-                    row.get('stories', row.get('STORIES', None)),
-                    row.get('actual_year_built', row.get('ACTUAL_YEAR_BUILT', None)),
-                    row.get('total_area', row.get('TOTAL_AREA', None))
+                    row.get('imprv_desc'),
+                    row.get('imprv_val'),
+                    row.get('living_area'),
+                    row.get('primary_use_cd'),
+                    row.get('stories'),
+                    row.get('actual_year_built'),
+                    row.get('total_area')
                 ))
-                count += 1
                 
-                # Commit every 100 records
-                if count % 100 == 0:
-                    conn.commit()
-                    print(f"Committed {count} improvements")
-                    
-            except Exception as e:
-                print(f"Error importing improvement {imprv_id}: {e}")
-                continue
+                # Send the queued rows to the server in a single round trip
+                if len(batch) >= BATCH_SIZE:
+                    execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+                    count += len(batch)
+                    batch = []
+        
+        if batch:
+            execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+            count += len(batch)
+        
+        # Drop the prepared statement and commit the whole file as a single transaction
+        cursor.execute("DEALLOCATE insert_improvements")
+        conn.commit()
+    except Exception as e:
+        # A failed row aborts the transaction, so the whole file is rolled back
+        conn.rollback()
+        print(f"Error importing improvements: {e}")
+        count = 0
+        # Prepared statements outlive a rollback, so drop it in its own transaction
+        cursor.execute("DEALLOCATE insert_improvements")
+        conn.commit()
     
-    # Final commit
-    conn.commit()
     print(f"Imported {count} improvements")
     return count
 
@@ -188,67 +236,89 @@ def import_improvement_details(conn, file_path):
     cursor = conn.cursor()
     count = 0
     
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
-            imprv_id = row.get('imprv_id', row.get('IMPRV_ID', '0'))
+    # Prepare the INSERT once so the server parses and plans it a single time
+    try:
+        cursor.execute("""
+            PREPARE insert_improvement_details AS
+            INSERT INTO improvement_details (
+                prop_id,
+                imprv_id,
+                living_area,
+                below_grade_living_area,
+                condition_cd,
+                imprv_det_sub_class_cd,
+                yr_built,
+                actual_age,
+                num_stories,
+                imprv_det_type_cd,
+                imprv_det_desc,
+                imprv_det_area,
+                imprv_det_class_cd
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+                $11, $12, $13
+            )
+        """)
+    except Exception as e:
+        conn.rollback()
+        print(f"Error preparing improvement details insert: {e}")
+        return 0
+    
+    execute_sql = """
+        EXECUTE insert_improvement_details (
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+        )
+    """
+    batch = []
+    
+    try:
+        with open(file_path, 'r') as f:
+            reader = csv.DictReader(f)
+            # Lowercase the header once so each field is a single dict lookup
+            reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
             
-            try:
-                cursor.execute("""
-                    INSERT INTO improvement_details (
-                        imported_at,
-                        updated_at,
-                        prop_id,
-                        imprv_id,
-                        living_area,
-                        below_grade_living_area,
-                        condition_cd,
-                        imprv_det_sub_class_cd,
-                        yr_built,
-                        actual_age,
-                        num_stories,
-                        imprv_det_type_cd,
-                        imprv_det_desc,
-                        imprv_det_area,
-                        imprv_det_class_cd
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    now,
-                    now,
+            for row in reader:
+                prop_id = row.get('prop_id', '0')
+                imprv_id = row.get('imprv_id', '0')
+                
+                batch.append((
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
                     int(imprv_id) if imprv_id and imprv_id.isdigit() else None,
-                    row.get('living_area', row.get('LIVING_AREA', None)),
-                    row.get('below_grade_living_area', row.get('BELOW_GRADE_LIVING_AREA', None)),
-                    row.get('condition_cd', row.get('CONDITION_CD', None)),
-                    row.get('imprv_det_sub_class_cd', row.get('IMPRV_DET_SUB_CLASS_CD', None)),
-                    row.get('yr_built', row.get('YR_BUILT', None)),
-                    row.get('actual_age', row.get('ACTUAL_AGE', None)),
-                    row.get('num_stories', row.get('NUM_STORIES', None)),
-                    row.get('imprv_det_type_cd', row.get('IMPRV_DET_TYPE_CD', None)),
-                    row.get('imprv_det_desc', row.get('IMPRV_DET_DESC', None)),
-                    row.get('imprv_det_area', row.get('IMPRV_DET_AREA', None)),
-                    row.get('imprv_det_class_cd', row.get('IMPRV_DET_CLASS_CD', None))
+                    row.get('living_area'),
+                    row.get('below_grade_living_area'),
+                    row.get('condition_cd'),
+                    row.get('imprv_det_sub_class_cd'),
+                    row.get('yr_built'),
+                    row.get('actual_age'),
+                    row.get('num_stories'),
+                    row.get('imprv_det_type_cd'),
+                    row.get('imprv_det_desc'),
+                    row.get('imprv_det_area'),
+                    row.get('imprv_det_class_cd')
                 ))
-                count += 1
                 
-                # Commit every 100 records
-                if count % 100 == 0:
-                    conn.commit()
-                    print(f"Committed {count} improvement details")
-                    
-            except Exception as e:
-                print(f"Error importing improvement detail for {imprv_id}: {e}")
-                continue
+                # Send the queued rows to the server in a single round trip
+                if len(batch) >= BATCH_SIZE:
+                    execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+                    count += len(batch)
+                    batch = []
+        
+        if batch:
+            execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+            count += len(batch)
+        
+        # Drop the prepared statement and commit the whole file as a single transaction
+        cursor.execute("DEALLOCATE insert_improvement_details")
+        conn.commit()
+    except Exception as e:
+        # A failed row aborts the transaction, so the whole file is rolled back
+        conn.rollback()
+        print(f"Error importing improvement details: {e}")
+        count = 0
+        # Prepared statements outlive a rollback, so drop it in its own transaction
+        cursor.execute("DEALLOCATE insert_improvement_details")
+        conn.commit()
     
-    # Final commit
-    conn.commit()
     print(f"Imported {count} improvement details")
     return count
 
@@ -259,65 +329,87 @@ def import_improvement_items(conn, file_path):
     cursor = conn.cursor()
     count = 0
     
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
-            imprv_id = row.get('imprv_id', row.get('IMPRV_ID', '0'))
+    # Prepare the INSERT once so the server parses and plans it a single time
+    try:
+        cursor.execute("""
+            PREPARE insert_improvement_items AS
+            INSERT INTO improvement_items (
+                prop_id,
+                imprv_id,
+                bedrooms,
+                baths,
+                half_bath,
+                foundation,
+                ext_wall,
+                roof,
+                heat,
+                ac,
+                fireplaces,
+                com_hvac
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+                $11, $12
+            )
+        """)
+    except Exception as e:
+        conn.rollback()
+        print(f"Error preparing improvement items insert: {e}")
+        return 0
+    
+    execute_sql = """
+        EXECUTE insert_improvement_items (
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+        )
+    """
+    batch = []
+    
+    try:
+        with open(file_path, 'r') as f:
+            reader = csv.DictReader(f)
+            # Lowercase the header once so each field is a single dict lookup
+            reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
             
-            try:
-                cursor.execute("""
-                    INSERT INTO improvement_items (
-                        imported_at,
-                        updated_at,
-                        prop_id,
-                        imprv_id,
-                        bedrooms,
-                        baths,
-                        half_bath,
-                        foundation,
-                        ext_wall,
-                        roof,
-                        heat,
-                        ac,
-                        fireplaces,
-                        com_hvac
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    now,
-                    now,
+            for row in reader:
+                prop_id = row.get('prop_id', '0')
+                imprv_id = row.get('imprv_id', '0')
+                
+                batch.append((
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
                     int(imprv_id) if imprv_id and imprv_id.isdigit() else None,
-                    row.get('bedrooms', row.get('BEDROOMS', None)),
-                    row.get('baths', row.get('BATHS', None)),
-                    row.get('half_bath', row.get('HALF_BATH', None)),
-                    row.get('foundation', row.get('FOUNDATION', None)),
-                    row.get('ext_wall', row.get('EXT_WALL', None)),
-                    row.get('roof', row.get('ROOF', None)),
-                    row.get('heat', row.get('HEAT', None)),
-                    row.get('ac', row.get('AC', None)),
-                    row.get('fireplaces', row.get('FIREPLACES', None)),
-                    row.get('com_hvac', row.get('COM_HVAC', None))
+                    row.get('bedrooms'),
+                    row.get('baths'),
+                    row.get('half_bath'),
+                    row.get('foundation'),
+                    row.get('ext_wall'),
+                    row.get('roof'),
+                    row.get('heat'),
+                    row.get('ac'),
+                    row.get('fireplaces'),
+                    row.get('com_hvac')
                 ))
-                count += 1
                 
-                # Commit every 100 records
-                if count % 100 == 0:
-                    conn.commit()
-                    print(f"Committed {count} improvement items")
-                    
-            except Exception as e:
-                print(f"Error importing improvement item for {imprv_id}: {e}")
-                continue
+                # Send the queued rows to the server in a single round trip
+                if len(batch) >= BATCH_SIZE:
+                    execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+                    count += len(batch)
+                    batch = []
+        
+        if batch:
+            execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+            count += len(batch)
+        
+        # Drop the prepared statement and commit the whole file as a single transaction
+        cursor.execute("DEALLOCATE insert_improvement_items")
+        conn.commit()
+    except Exception as e:
+        # A failed row aborts the transaction, so the whole file is rolled back
+        conn.rollback()
+        print(f"Error importing improvement items: {e}")
+        count = 0
+        # Prepared statements outlive a rollback, so drop it in its own transaction
+        cursor.execute("DEALLOCATE insert_improvement_items")
+        conn.commit()
     
-    # Final commit
-    conn.commit()
     print(f"Imported {count} improvement items")
     return count
 
@@ -328,54 +420,75 @@ def import_land_details(conn, file_path):
     cursor = conn.cursor()
     count = 0
     
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
+    # Prepare the INSERT once so the server parses and plans it a single time
+    try:
+        cursor.execute("""
+            PREPARE insert_land_details AS
+            INSERT INTO land_details (
+                prop_id,
+                primary_use_cd,
+                size_acres,
+                size_square_feet,
+                land_type_cd,
+                land_soil_code,
+                ag_use_cd
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7
+            )
+        """)
+    except Exception as e:
+        conn.rollback()
+        print(f"Error preparing land details insert: {e}")
+        return 0
+    
+    execute_sql = """
+        EXECUTE insert_land_details (
+            %s, %s, %s, %s, %s, %s, %s
+        )
+    """
+    batch = []
+    
+    try:
+        with open(file_path, 'r') as f:
+            reader = csv.DictReader(f)
+            # Lowercase the header once so each field is a single dict lookup
+            reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
             
-            try:
-                cursor.execute("""
-                    INSERT INTO land_details (
-                        imported_at,
-                        updated_at,
-                        prop_id,
-                        primary_use_cd,
-                        size_acres,
-                        size_square_feet,
-                        land_type_cd,
-                        land_soil_code,
-                        ag_use_cd
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    now,
-                    now,
+            for row in reader:
+                prop_id = row.get('prop_id', '0')
+                
+                batch.append((
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
-                    row.get('primary_use_cd', row.get('PRIMARY_USE_CD', None)),
-                    row.get('size_acres', row.get('SIZE_ACRES', None)),
-                    row.get('size_square_feet', row.get('SIZE_SQUARE_FEET', None)),
-                    row.get('land_type_cd', row.get('LAND_TYPE_CD', None)),
-                    row.get('land_soil_code', row.get('LAND_SOIL_CODE', None)),
-                    row.get('ag_use_cd', row.get('AG_USE_CD', None))
+                    row.get('primary_use_cd'),
+                    row.get('size_acres'),
+                    row.get('size_square_feet'),
+                    row.get('land_type_cd'),
+                    row.get('land_soil_code'),
+                    row.get('ag_use_cd')
                 ))
-                count += 1
                 
-                # Commit every 100 records
-                if count % 100 == 0:
-                    conn.commit()
-                    print(f"Committed {count} land details")
-                    
-            except Exception as e:
-                print(f"Error importing land detail for property {prop_id}: {e}")
-                continue
+                # Send the queued rows to the server in a single round trip
+                if len(batch) >= BATCH_SIZE:
+                    execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+                    count += len(batch)
+                    batch = []
+        
+        if batch:
+            execute_batch(cursor, execute_sql, batch, page_size=BATCH_SIZE)
+            count += len(batch)
+        
+        # Drop the prepared statement and commit the whole file as a single transaction
+        cursor.execute("DEALLOCATE insert_land_details")
+        conn.commit()
+    except Exception as e:
+        # A failed row aborts the transaction, so the whole file is rolled back
+        conn.rollback()
+        print(f"Error importing land details: {e}")
+        count = 0
+        # Prepared statements outlive a rollback, so drop it in its own transaction
+        cursor.execute("DEALLOCATE insert_land_details")
+        conn.commit()
     
-    # Final commit
-    conn.commit()
     print(f"Imported {count} land details")
     return count
 
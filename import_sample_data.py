@@ -29,22 +29,19 @@ def import_properties(conn, file_path):
     
     with open(file_path, 'r') as f:
         reader = csv.DictReader(f)
+        # Lowercase the header once so each field is a single dict lookup
+        reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
         
         for row in reader:
             if count >= MAX_RECORDS:
                 break
                 
             # Convert property CSV data to database format
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
+            prop_id = row.get('prop_id', '0')
             
             try:
                 cursor.execute("""
                     INSERT INTO properties (
-                        imported_at,
-                        updated_at,
                         prop_id,
                         block,
                         tract_or_lot,
@@ -75,38 +72,36 @@ def import_properties(conn, file_path):
                     ) VALUES (
                         %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
                         %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        %s, %s, %s, %s, %s, %s, %s
                     )
                 """, (
-                    now, 
-                    now,
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
-                    row.get('block', row.get('BLOCK', None)),
-                    row.get('tract_or_lot', row.get('TRACT_OR_LOT', None)),
-                    row.get('legal_desc', row.get('LEGAL_DESC', None)),
-                    row.get('legal_desc_2', row.get('LEGAL_DESC_2', None)),
-                    row.get('township_section', row.get('TOWNSHIP_SECTION', None)),
-                    row.get('township_code', row.get('TOWNSHIP_CODE', None)),
-                    row.get('range_code', row.get('RANGE_CODE', None)),
-                    row.get('township_q_section', row.get('TOWNSHIP_Q_SECTION', None)),
-                    row.get('cycle', row.get('CYCLE', None)),
-                    row.get('property_use_cd', row.get('PROPERTY_USE_CD', None)),
-                    row.get('property_use_desc', row.get('PROPERTY_USE_DESC', None)),
-                    row.get('market', row.get('MARKET', None)),
-                    row.get('land_hstd_val', row.get('LAND_HSTD_VAL', None)),
-                    row.get('land_non_hstd_val', row.get('LAND_NON_HSTD_VAL', None)),
-                    row.get('imprv_hstd_val', row.get('IMPRV_HSTD_VAL', None)),
-                    row.get('imprv_non_hstd_val', row.get('IMPRV_NON_HSTD_VAL', None)),
-                    row.get('hood_cd', row.get('HOOD_CD', None)),
-                    row.get('abs_subdv_cd', row.get('ABS_SUBDV_CD', None)),
-                    row.get('appraised_val', row.get('APPRAISED_VAL', None)),
-                    row.get('assessed_val', row.get('ASSESSED_VAL', None)),
-                    row.get('legal_acreage', row.get('LEGAL_ACREAGE', None)),
-                    row.get('prop_type_cd', row.get('PROP_TYPE_CD', None)),
-                    row.get('image_path', row.get('IMAGE_PATH', None)),
-                    row.get('geo_id', row.get('GEO_ID', None)),
-                    row.get('isactive', row.get('ISACTIVE', '1')) == '1',
-                    row.get('tca', row.get('TCA', None))
+                    row.get('block'),
+                    row.get('tract_or_lot'),
+                    row.get('legal_desc'),
+                    row.get('legal_desc_2'),
+                    row.get('township_section'),
+                    row.get('township_code'),
+                    row.get('range_code'),
+                    row.get('township_q_section'),
+                    row.get('cycle'),
+                    row.get('property_use_cd'),
+                    row.get('property_use_desc'),
+                    row.get('market'),
+                    row.get('land_hstd_val'),
+                    row.get('land_non_hstd_val'),
+                    row.get('imprv_hstd_val'),
+                    row.get('imprv_non_hstd_val'),
+                    row.get('hood_cd'),
+                    row.get('abs_subdv_cd'),
+                    row.get('appraised_val'),
+                    row.get('assessed_val'),
+                    row.get('legal_acreage'),
+                    row.get('prop_type_cd'),
+                    row.get('image_path'),
+                    row.get('geo_id'),
+                    row.get('isactive', '1') == '1',
+                    row.get('tca')
                 ))
                 count += 1
                     
@@ -128,22 +123,19 @@ def import_improvements(conn, file_path):
     
     with open(file_path, 'r') as f:
         reader = csv.DictReader(f)
+        # Lowercase the header once so each field is a single dict lookup
+        reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
         
         for row in reader:
             if count >= MAX_RECORDS:
                 break
                 
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
-            imprv_id = row.get('imprv_id', row.get('IMPRV_ID', '0'))
+            prop_id = row.get('prop_id', '0')
+            imprv_id = row.get('imprv_id', '0')
             
             try:
                 cursor.execute("""
                     INSERT INTO improvements (
-                        imported_at,
-                        updated_at,
                         prop_id,
                         imprv_id,
                         imprv_desc,
@@ -154,20 +146,18 @@ def import_improvements(conn, file_path):
                         actual_year_built,
                         total_area
                     ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s
                     )
                 """, (
-                    now,
-                    now,
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
                     int(imprv_id) if imprv_id and imprv_id.isdigit() else None,
-                    row.get('imprv_desc', row.get('IMPRV_DESC', None)),
-                    row.get('imprv_val', row.get('IMPRV_VAL', None)),
-                    row.get('living_area', row.get('LIVING_AREA', None)),
-                    row.get('primary_use_cd', row.get('PRIMARY_USE_CD', None)),
-                    row.get('stories', row.get('STORIES', None)),
-                    row.get('actual_year_built', row.get('ACTUAL_YEAR_BUILT', None)),
-                    row.get('total_area', row.get('TOTAL_AREA', None))
+                    row.get('imprv_desc'),
+                    row.get('imprv_val'),
+                    row.get('living_area'),
+                    row.get('primary_use_cd'),
+                    row.get('stories'),
+                    row.get('actual_year_built'),
+                    row.get('total_area')
                 ))
                 count += 1
                     
@@ -189,22 +179,19 @@ def import_improvement_details(conn, file_path):
     
     with open(file_path, 'r') as f:
         reader = csv.DictReader(f)
+        # Lowercase the header once so each field is a single dict lookup
+        reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
         
         for row in reader:
             if count >= MAX_RECORDS:
                 break
                 
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
-            imprv_id = row.get('imprv_id', row.get('IMPRV_ID', '0'))
+            prop_id = row.get('prop_id', '0')
+            imprv_id = row.get('imprv_id', '0')
             
             try:
                 cursor.execute("""
                     INSERT INTO improvement_details (
-                        imported_at,
-                        updated_at,
                         prop_id,
                         imprv_id,
                         living_area,
@@ -219,24 +206,22 @@ def import_improvement_details(conn, file_path):
                         imprv_det_area,
                         imprv_det_class_cd
                     ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                     )
                 """, (
-                    now,
-                    now,
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
                     int(imprv_id) if imprv_id and imprv_id.isdigit() else None,
-                    row.get('living_area', row.get('LIVING_AREA', None)),
-                    row.get('below_grade_living_area', row.get('BELOW_GRADE_LIVING_AREA', None)),
-                    row.get('condition_cd', row.get('CONDITION_CD', None)),
-                    row.get('imprv_det_sub_class_cd', row.get('IMPRV_DET_SUB_CLASS_CD', None)),
-                    row.get('yr_built', row.get('YR_BUILT', None)),
-                    row.get('actual_age', row.get('ACTUAL_AGE', None)),
-                    row.get('num_stories', row.get('NUM_STORIES', None)),
-                    row.get('imprv_det_type_cd', row.get('IMPRV_DET_TYPE_CD', None)),
-                    row.get('imprv_det_desc', row.get('IMPRV_DET_DESC', None)),
-                    row.get('imprv_det_area', row.get('IMPRV_DET_AREA', None)),
-                    row.get('imprv_det_class_cd', row.get('IMPRV_DET_CLASS_CD', None))
+                    row.get('living_area'),
+                    row.get('below_grade_living_area'),
+                    row.get('condition_cd'),
+                    row.get('imprv_det_sub_class_cd'),
+                    row.get('yr_built'),
+                    row.get('actual_age'),
+                    row.get('num_stories'),
+                    row.get('imprv_det_type_cd'),
+                    row.get('imprv_det_desc'),
+                    row.get('imprv_det_area'),
+                    row.get('imprv_det_class_cd')
                 ))
                 count += 1
                     
@@ -258,22 +243,19 @@ def import_improvement_items(conn, file_path):
     
     with open(file_path, 'r') as f:
         reader = csv.DictReader(f)
+        # Lowercase the header once so each field is a single dict lookup
+        reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
         
         for row in reader:
             if count >= MAX_RECORDS:
                 break
                 
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
-            imprv_id = row.get('imprv_id', row.get('IMPRV_ID', '0'))
+            prop_id = row.get('prop_id', '0')
+            imprv_id = row.get('imprv_id', '0')
             
             try:
                 cursor.execute("""
                     INSERT INTO improvement_items (
-                        imported_at,
-                        updated_at,
                         prop_id,
                         imprv_id,
                         bedrooms,
@@ -287,23 +269,21 @@ def import_improvement_items(conn, file_path):
                         fireplaces,
                         com_hvac
                     ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                     )
                 """, (
-                    now,
-                    now,
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
                     int(imprv_id) if imprv_id and imprv_id.isdigit() else None,
-                    row.get('bedrooms', row.get('BEDROOMS', None)),
-                    row.get('baths', row.get('BATHS', None)),
-                    row.get('half_bath', row.get('HALF_BATH', None)),
-                    row.get('foundation', row.get('FOUNDATION', None)),
-                    row.get('ext_wall', row.get('EXT_WALL', None)),
-                    row.get('roof', row.get('ROOF', None)),
-                    row.get('heat', row.get('HEAT', None)),
-                    row.get('ac', row.get('AC', None)),
-                    row.get('fireplaces', row.get('FIREPLACES', None)),
-                    row.get('com_hvac', row.get('COM_HVAC', None))
+                    row.get('bedrooms'),
+                    row.get('baths'),
+                    row.get('half_bath'),
+                    row.get('foundation'),
+                    row.get('ext_wall'),
+                    row.get('roof'),
+                    row.get('heat'),
+                    row.get('ac'),
+                    row.get('fireplaces'),
+                    row.get('com_hvac')
                 ))
                 count += 1
                     
@@ -325,21 +305,18 @@ def import_land_details(conn, file_path):
     
     with open(file_path, 'r') as f:
         reader = csv.DictReader(f)
+        # Lowercase the header once so each field is a single dict lookup
+        reader.fieldnames = [name.lower() for name in reader.fieldnames or []]
         
         for row in reader:
             if count >= MAX_RECORDS:
                 break
                 
-            now = datetime.now()
-            
-            # Default to lowercase column names if uppercase not found
-            prop_id = row.get('prop_id', row.get('PROP_ID', '0'))
+            prop_id = row.get('prop_id', '0')
             
             try:
                 cursor.execute("""
                     INSERT INTO land_details (
-                        imported_at,
-                        updated_at,
                         prop_id,
                         primary_use_cd,
                         size_acres,
@@ -348,18 +325,16 @@ def import_land_details(conn, file_path):
                         land_soil_code,
                         ag_use_cd
                     ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        %s, %s, %s, %s, %s, %s, %s
                     )
                 """, (
-                    now,
-                    now,
                     int(prop_id) if prop_id and prop_id.isdigit() else None,
-                    row.get('primary_use_cd', row.get('PRIMARY_USE_CD', None)),
-                    row.get('size_acres', row.get('SIZE_ACRES', None)),
-                    row.get('size_square_feet', row.get('SIZE_SQUARE_FEET', None)),
-                    row.get('land_type_cd', row.get('LAND_TYPE_CD', None)),
-                    row.get('land_soil_code', row.get('LAND_SOIL_CODE', None)),
-                    row.get('ag_use_cd', row.get('AG_USE_CD', None))
+                    row.get('primary_use_cd'),
+                    row.get('size_acres'),
+                    row.get('size_square_feet'),
+                    row.get('land_type_cd'),
+                    row.get('land_soil_code'),
+                    row.get('ag_use_cd')
                 ))
                 count += 1
                     
@@ -0,0 +1,45 @@
+"""
+Import Utilities
+
+Helpers shared by the standalone CSV import scripts (improvement items, land
+details and property details).
+"""
+from psycopg2.extras import execute_values
+
+# Number of rows sent to the database in each multi-row INSERT
+BATCH_SIZE = 1000
+
+def insert_batch(conn, insert_sql, batch, label):
+    """
+    Insert a batch of rows with a single multi-row INSERT and commit it.
+
+    If the batch fails it is rolled back and retried one row at a time, so a
+    bad row only loses that row. Returns a tuple of (rows inserted, rows that
+    failed); rows skipped by ON CONFLICT DO NOTHING count as neither.
+    """
+    cursor = conn.cursor()
+    try:
+        execute_values(cursor, insert_sql, batch, page_size=BATCH_SIZE)
+        inserted = cursor.rowcount
+        conn.commit()
+        print(f"Committed {inserted} {label}")
+        return inserted, 0
+    except Exception as e:
+        # Rollback the transaction on error
+        conn.rollback()
+        print(f"Error importing batch of {len(batch)} {label}, retrying row by row: {e}")
+
+    inserted = 0
+    errors = 0
+    for row in batch:
+        try:
+            execute_values(cursor, insert_sql, [row])
+            inserted += cursor.rowcount
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"Error importing {label} row {row[:2]}: {e}")
+            errors += 1
+
+    print(f"Committed {inserted} {label}")
+    return inserted, errors
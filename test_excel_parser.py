@@ -154,7 +154,20 @@ class TestEnhancedExcelParser(unittest.TestCase):
         # Should fail gracefully
         self.assertFalse(result['success'])
         self.assertTrue(len(result['errors']) > 0)
-        
+
+    def test_missing_file_raises_file_not_found(self):
+        """Test that a missing file is reported as missing whatever its extension"""
+        for file_path in ("non_existent_file.xlsx", "non_existent_file.csv"):
+            with self.subTest(file_path=file_path):
+                with self.assertRaises(FileNotFoundError) as cm:
+                    EnhancedExcelParser(file_path)
+                self.assertIn(file_path, str(cm.exception))
+
+    def test_wrong_extension_raises_value_error(self):
+        """Test that an existing file without an Excel extension is rejected"""
+        with self.assertRaises(ValueError):
+            EnhancedExcelParser(__file__)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Excel Parser Result Cache
+
+This module contains unit tests for the parse result cache used by parse_file.
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import numpy as np
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append('.')
+
+# Import the module to test
+import enhanced_excel_parser
+
+PARSE_RESULT = {"success": True, "data": [], "metadata": {"validationErrors": []}}
+NUMPY_PARSE_RESULT = {
+    "success": True,
+    "data": [{"matrixId": np.int64(7), "baseCost": np.float64(125.5), "costs": np.array([1, 2])}],
+    "metadata": {"validationErrors": []}
+}
+
+class TestParseCache(unittest.TestCase):
+    """Tests for parse_file's result cache"""
+
+    def setUp(self):
+        """Set up a workbook file and an empty cache directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.file_path = os.path.join(self.temp_dir.name, "matrix.xlsx")
+        with open(self.file_path, "wb") as f:
+            f.write(b"workbook")
+
+        patcher = patch.object(enhanced_excel_parser, "PARSE_CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch.object(enhanced_excel_parser, "EnhancedExcelParser")
+        self.mock_parser = patcher.start()
+        self.mock_parser.return_value.parse.return_value = PARSE_RESULT
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the workbook and cache directory"""
+        self.temp_dir.cleanup()
+
+    def test_miss_parses_and_caches(self):
+        """Test that the first parse of a file runs the parser and writes a cache entry"""
+        result = enhanced_excel_parser.parse_file(self.file_path)
+
+        self.assertEqual(result, PARSE_RESULT)
+        self.assertEqual(self.mock_parser.call_count, 1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+
+    def test_hit_skips_parse(self):
+        """Test that an unchanged file is served from the cache"""
+        enhanced_excel_parser.parse_file(self.file_path)
+        result = enhanced_excel_parser.parse_file(self.file_path)
+
+        self.assertEqual(result, PARSE_RESULT)
+        self.assertEqual(self.mock_parser.call_count, 1)
+
+    def test_changed_file_misses(self):
+        """Test that a modified file is parsed again"""
+        enhanced_excel_parser.parse_file(self.file_path)
+        with open(self.file_path, "ab") as f:
+            f.write(b" updated")
+        enhanced_excel_parser.parse_file(self.file_path)
+
+        self.assertEqual(self.mock_parser.call_count, 2)
+
+    def test_parser_version_change_misses(self):
+        """Test that results cached by another parser version are not reused"""
+        enhanced_excel_parser.parse_file(self.file_path)
+        with patch.object(enhanced_excel_parser, "PARSE_CACHE_VERSION", "other-version"):
+            enhanced_excel_parser.parse_file(self.file_path)
+
+        self.assertEqual(self.mock_parser.call_count, 2)
+
+    def test_numpy_result_is_cached(self):
+        """Test that a result holding numpy values is cached and read back as plain JSON"""
+        self.mock_parser.return_value.parse.return_value = NUMPY_PARSE_RESULT
+        for orjson_module in (enhanced_excel_parser.orjson, None):
+            with self.subTest(orjson=orjson_module is not None), \
+                    patch.object(enhanced_excel_parser, "orjson", orjson_module):
+                shutil.rmtree(self.cache_dir, ignore_errors=True)
+                self.mock_parser.reset_mock()
+
+                enhanced_excel_parser.parse_file(self.file_path)
+                result = enhanced_excel_parser.parse_file(self.file_path)
+
+                self.assertEqual(self.mock_parser.call_count, 1)
+                self.assertEqual(result["data"], [{"matrixId": 7, "baseCost": 125.5, "costs": [1, 2]}])
+                self.assertEqual([name for name in os.listdir(self.cache_dir) if name.endswith(".tmp")], [])
+
+    def test_disabled_cache_always_parses(self):
+        """Test that disabling the cache parses every time and writes nothing"""
+        with patch.object(enhanced_excel_parser, "PARSE_CACHE_ENABLED", False):
+            enhanced_excel_parser.parse_file(self.file_path)
+            enhanced_excel_parser.parse_file(self.file_path)
+
+        self.assertEqual(self.mock_parser.call_count, 2)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
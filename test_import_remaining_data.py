@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Remaining Property Data Import
+
+This module contains database tests for the COPY-based copy_import helper. They
+need a PostgreSQL database in TEST_DATABASE_URL and are skipped without one.
+"""
+
+import unittest
+import os
+import sys
+import csv
+import tempfile
+
+import psycopg2
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append('.')
+
+# Import the module to test
+import import_remaining_data
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+TEST_SCHEMA = f"test_copy_import_{os.getpid()}"
+
+@unittest.skipUnless(TEST_DATABASE_URL, "TEST_DATABASE_URL is not set")
+class TestCopyImport(unittest.TestCase):
+    """Tests for copy_import against a throwaway schema"""
+
+    def setUp(self):
+        """Create the properties and target tables in a fresh schema"""
+        admin = psycopg2.connect(TEST_DATABASE_URL)
+        admin.autocommit = True
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE")
+            cursor.execute(f"CREATE SCHEMA {TEST_SCHEMA}")
+        admin.close()
+
+        self.conn = psycopg2.connect(TEST_DATABASE_URL, options=f"-c search_path={TEST_SCHEMA}")
+        with self.conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE properties (prop_id integer NOT NULL UNIQUE);
+                INSERT INTO properties (prop_id) VALUES (1), (2), (3);
+                CREATE TABLE improvements (
+                    prop_id integer NOT NULL,
+                    imprv_id integer NOT NULL,
+                    imprv_desc text,
+                    imported_at timestamp DEFAULT now() NOT NULL,
+                    updated_at timestamp DEFAULT now() NOT NULL
+                );
+                CREATE UNIQUE INDEX prop_imprv_idx ON improvements (prop_id, imprv_id);
+                CREATE TABLE improvement_details (
+                    prop_id integer NOT NULL,
+                    imprv_id integer NOT NULL,
+                    imprv_det_desc text,
+                    imported_at timestamp DEFAULT now() NOT NULL,
+                    updated_at timestamp DEFAULT now() NOT NULL
+                );
+            """)
+        self.conn.commit()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Drop the test schema"""
+        self.conn.rollback()
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {TEST_SCHEMA} CASCADE")
+        self.conn.commit()
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def write_csv(self, header, rows):
+        """Write a CSV file to the temp directory and return its path"""
+        file_path = os.path.join(self.temp_dir.name, "input.csv")
+        with open(file_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        return file_path
+
+    def fetch(self, query):
+        """Run a query and return all rows"""
+        with self.conn.cursor() as cursor:
+            cursor.execute(query)
+            return cursor.fetchall()
+
+    def test_duplicate_key_in_file_is_skipped(self):
+        """Test that a key repeated within the file only loses the repeated row"""
+        file_path = self.write_csv(
+            ['PROP_ID', 'IMPRV_ID', 'IMPRV_DESC'],
+            [['1', '1', 'first'], ['1', '1', 'repeat'], ['2', '1', 'other'], ['9', '1', 'unknown property']]
+        )
+
+        count = import_remaining_data.copy_import(
+            self.conn, 'improvements', ('prop_id', 'imprv_id'), file_path,
+            ('prop_id', 'imprv_id', 'imprv_desc'),
+            converters={'prop_id': import_remaining_data.parse_int,
+                        'imprv_id': import_remaining_data.parse_int}
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            self.fetch("SELECT prop_id, imprv_id, imprv_desc FROM improvements ORDER BY prop_id"),
+            [(1, 1, 'first'), (2, 1, 'other')]
+        )
+
+    def test_repeated_key_kept_without_unique_index(self):
+        """Test that repeated keys are all loaded into a table without a unique index"""
+        file_path = self.write_csv(
+            ['prop_id', 'imprv_id', 'imprv_det_desc'],
+            [['1', '1', 'a'], ['1', '1', 'b']]
+        )
+
+        count = import_remaining_data.copy_import(
+            self.conn, 'improvement_details', ('prop_id', 'imprv_id'), file_path,
+            ('prop_id', 'imprv_id', 'imprv_det_desc'),
+            converters={'prop_id': import_remaining_data.parse_int,
+                        'imprv_id': import_remaining_data.parse_int}
+        )
+
+        self.assertEqual(count, 2)
+
+    def test_null_key_rows_are_skipped(self):
+        """Test that rows with an empty or non-numeric key are skipped"""
+        file_path = self.write_csv(
+            ['prop_id', 'imprv_id', 'imprv_desc'],
+            [['1', '', 'empty'], ['2', 'x', 'text'], ['3', '4', 'valid']]
+        )
+
+        count = import_remaining_data.copy_import(
+            self.conn, 'improvements', ('prop_id', 'imprv_id'), file_path,
+            ('prop_id', 'imprv_id', 'imprv_desc'),
+            converters={'prop_id': import_remaining_data.parse_int,
+                        'imprv_id': import_remaining_data.parse_int}
+        )
+
+        self.assertEqual(count, 1)
+        self.assertEqual(self.fetch("SELECT prop_id, imprv_id FROM improvements"), [(3, 4)])
+
+
+if __name__ == '__main__':
+    unittest.main()